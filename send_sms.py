@@ -6,27 +6,62 @@ Uses the router's REST API to send SMS messages.
 
 import requests
 import json
+import re
 import sys
 import os
 import argparse
+import functools
 import time
 import logging
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # YAML-Support
 try:
     import yaml
 except ImportError:
-    print("✗ Error: PyYAML is not installed. Install it with: pip install pyyaml")
+    print("[FAIL] Error: PyYAML is not installed. Install it with: pip install pyyaml")
     sys.exit(1)
 
+# JSON: use orjson if installed (faster), otherwise the standard library
+try:
+    import orjson
+    
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode('utf-8')
+    
+    _json_loads = json.loads
+
 # Disable SSL warnings for self-signed certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Modem used when no modem is specified and the modem list is unavailable (Primary)
+DEFAULT_MODEM_ID = "1-1.4"
+
+# Phone number normalization: formatting characters to drop, "+<country code>" prefix
+_PHONE_STRIP_TABLE = str.maketrans("", "", " -()/.")
+_COUNTRY_CODE_RE = re.compile(r'^\+(\d{1,3})(.*)$')
+
+# Token cache file name: router URL without scheme, "/" and "." replaced by "_"
+_URL_SCHEME_RE = re.compile(r'^https?://')
+_CACHE_NAME_TABLE = str.maketrans("/.", "__")
+
+# GSM-7 default alphabet (GSM 03.38) and extension table; extension characters
+# take two septets. Messages with other characters are sent as UCS-2.
+_GSM7_BASIC = frozenset(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+_GSM7_EXTENSION = frozenset("\f^{}\\[~]|€")
+
 
 def configure_cli_logging():
     """Configure root logging for CLI usage when no handlers exist yet."""
@@ -37,42 +72,183 @@ def configure_cli_logging():
         )
 
 
-def split_at_word_boundary(text: str, max_length: int) -> tuple[str, str]:
+def split_at_word_boundary(text: str, max_length: int, start: int = 0) -> tuple[int, int]:
     """
-    Splits text at a word boundary if possible.
+    Finds a split point at a word boundary if possible.
+    
+    Works on indices so callers can slice each part once instead of copying
+    the remaining text for every part.
     
     Args:
         text: Text to split
         max_length: Maximum length of the first part
+        start: Index in text where the first part begins
     
     Returns:
-        Tuple (first_part, rest)
+        Tuple (end_of_part, start_of_rest) as indices into text; surrounding
+        whitespace is excluded from both the part and the rest
+    """
+    text_length = len(text)
+    if text_length - start <= max_length:
+        return text_length, text_length
+    
+    limit = start + max_length
+    
+    # Search for word boundaries (spaces, line breaks, tabs) in the last
+    # 20 characters; a separator right at max_length is stripped afterwards
+    window_start = start + max(0, max_length - 20) + 1
+    window_end = limit + 1
+    separator = max(
+        text.rfind(' ', window_start, window_end),
+        text.rfind('\n', window_start, window_end),
+        text.rfind('\t', window_start, window_end),
+        text.rfind('\r', window_start, window_end)
+    )
+    
+    # If no space found, search for other separators in the last 10 characters
+    # (the separator stays in the first part, so it must fit within max_length)
+    if separator < 0:
+        window_start = start + max(0, max_length - 10) + 1
+        separator = max(
+            text.rfind(char, window_start, limit)
+            for char in ('.', ',', ';', ':', '!', '?', '-', '–', '—')
+        )
+    
+    # Cut after the separator; if nothing found, hard split
+    best_split = separator + 1 if separator >= 0 else limit
+    
+    # Exclude trailing whitespace of the part and leading whitespace of the rest
+    end = best_split
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    rest_start = best_split
+    while rest_start < text_length and text[rest_start].isspace():
+        rest_start += 1
+    
+    return end, rest_start
+
+
+def _part_length_limit(text: str, start: int = 0, max_length: int = 160, reserved: int = 0) -> int:
     """
-    if len(text) <= max_length:
-        return text, ""
+    Returns how many characters of text, starting at start, fit into one SMS.
+    
+    Each SMS is encoded on its own: as GSM-7 if its characters allow it
+    (extension characters such as "€" take two septets), otherwise as UCS-2
+    with 70 instead of 160 characters (characters outside the Basic
+    Multilingual Plane, e.g. emoji, take two UCS-2 units).
+    
+    Args:
+        text: Text to send
+        start: Index in text where the SMS begins
+        max_length: Maximum length per SMS in GSM-7 characters
+        reserved: Characters of the SMS already used (e.g. numbering prefix)
     
-    # Search for word boundaries (spaces, line breaks, tabs)
-    # Go backwards from max_length to find the best split point
-    best_split = max_length
+    Returns:
+        Maximum number of characters for this SMS (at least 1)
+    """
+    gsm7_budget = max_length - reserved
+    window = text[start:start + gsm7_budget]
+    if set(window) <= _GSM7_BASIC:
+        return max(gsm7_budget, 1)
     
-    # Search for spaces, line breaks, tabs
-    for i in range(max_length, max(0, max_length - 20), -1):
-        if i < len(text) and text[i] in (' ', '\n', '\t', '\r'):
-            best_split = i + 1  # Cut after the separator
+    # Longest GSM-7 prefix: up to the septet budget or the first non-GSM-7 character
+    gsm7_count = 0
+    septets = 0
+    needs_ucs2 = False
+    for char in window:
+        if char in _GSM7_BASIC:
+            septets += 1
+        elif char in _GSM7_EXTENSION:
+            septets += 2
+        else:
+            needs_ucs2 = True
             break
+        if septets > gsm7_budget:
+            break
+        gsm7_count += 1
+    if not needs_ucs2:
+        return max(gsm7_count, 1)
     
-    # If no space found, search for other separators
-    if best_split == max_length:
-        for i in range(max_length, max(0, max_length - 10), -1):
-            if i < len(text) and text[i] in ('.', ',', ';', ':', '!', '?', '-', '–', '—'):
-                best_split = i + 1
-                break
+    # Longest UCS-2 prefix; an SMS with a shorter GSM-7 prefix would fit more
+    ucs2_budget = max_length * 70 // 160 - reserved
+    ucs2_count = 0
+    units = 0
+    for char in text[start:start + ucs2_budget]:
+        units += 2 if ord(char) > 0xFFFF else 1
+        if units > ucs2_budget:
+            break
+        ucs2_count += 1
+    return max(gsm7_count, ucs2_count, 1)
+
+
+def _fits_in_one_sms(message: str, max_length: int = 160) -> bool:
+    """
+    Checks if a message can be sent as a single SMS.
     
-    # If still nothing found, hard split (only if really necessary)
-    if best_split == max_length:
-        best_split = max_length
+    Args:
+        message: Message to send
+        max_length: Maximum length per SMS in GSM-7 characters
     
-    return text[:best_split].rstrip(), text[best_split:].lstrip()
+    Returns:
+        True if the message does not need to be split
+    """
+    return len(message) <= _part_length_limit(message, 0, max_length)
+
+
+def _split_into_parts(text: str, max_length: int, reserved: int = 0) -> List[str]:
+    """
+    Splits text into SMS-sized parts at word boundaries.
+    
+    Args:
+        text: Text to split
+        max_length: Maximum length per SMS in GSM-7 characters (the limit of
+            each part depends on its own characters, see _part_length_limit)
+        reserved: Characters per SMS reserved for the numbering prefix
+    
+    Returns:
+        List of parts (without numbering)
+    """
+    parts = []
+    text_length = len(text)
+    cursor = 0
+    while cursor < text_length:
+        part_length = _part_length_limit(text, cursor, max_length, reserved)
+        if text_length - cursor <= part_length:
+            # Rest fits in one part
+            parts.append(text[cursor:])
+            break
+        
+        # Split at word boundary (a whitespace-only part is skipped)
+        end, cursor_next = split_at_word_boundary(text, part_length, cursor)
+        if end > cursor:
+            parts.append(text[cursor:end])
+        cursor = cursor_next
+    return parts
+
+
+def _estimate_parts(message_length: int, max_length: int) -> int:
+    """
+    Estimates the number of numbered parts needed for a message.
+    
+    The numbering prefix ("k/k: ") reduces the space per part, which can in
+    turn increase the number of parts, so iterate until the count is stable.
+    
+    Args:
+        message_length: Length of the message in characters
+        max_length: Maximum length per SMS including numbering
+    
+    Returns:
+        Estimated number of parts
+    """
+    parts = (message_length + max_length - 1) // max_length
+    while True:
+        available_length = max_length - len(f"{parts}/{parts}: ")
+        if available_length <= 0:
+            return parts
+        new_parts = (message_length + available_length - 1) // available_length
+        if new_parts == parts:
+            return parts
+        parts = new_parts
 
 
 def split_sms_message(message: str, max_length: int = 160, add_numbering: bool = True) -> List[str]:
@@ -82,7 +258,8 @@ def split_sms_message(message: str, max_length: int = 160, add_numbering: bool =
     
     Args:
         message: Message to split
-        max_length: Maximum length per SMS (default: 160 characters)
+        max_length: Maximum length per SMS (default: 160 characters, reduced
+            automatically for parts that need UCS-2, e.g. to 70 characters)
         add_numbering: If True, adds numbering (e.g. "1/3: ", "2/3: ", "3/3: ")
     
     Returns:
@@ -91,101 +268,42 @@ def split_sms_message(message: str, max_length: int = 160, add_numbering: bool =
     if not message:
         return [""]
     
-    if len(message) <= max_length:
+    if _fits_in_one_sms(message, max_length):
         return [message]
     
     if add_numbering:
-        # Estimate number of parts
-        estimated_parts = (len(message) + max_length - 1) // max_length
-        
-        # Calculate maximum length of numbering prefix
-        # For up to 999 parts: "999/999: " = 9 characters
-        max_numbering_length = len(f"{estimated_parts}/{estimated_parts}: ")
-        
-        # Reduce available length by numbering
-        available_length = max_length - max_numbering_length
-        
-        # Split message at word boundaries
-        parts = []
-        remaining_text = message
-        
-        while remaining_text:
-            if len(remaining_text) <= available_length:
-                # Rest fits in one part
-                parts.append(remaining_text)
+        # Reserve space for the numbering prefix of the estimated part count
+        # (a lower bound, the count can only grow below)
+        total_parts = _estimate_parts(len(message), max_length)
+        while True:
+            parts = _split_into_parts(message, max_length, len(f"{total_parts}/{total_parts}: "))
+            # Word-boundary splitting can need more parts than estimated; only
+            # re-split if that makes the numbering prefix longer
+            if len(str(len(parts))) <= len(str(total_parts)):
                 break
-            
-            # Split at word boundary
-            part, remaining_text = split_at_word_boundary(remaining_text, available_length)
-            if part:
-                parts.append(part)
-            else:
-                # Fallback: If no word found, hard split
-                parts.append(remaining_text[:available_length])
-                remaining_text = remaining_text[available_length:].lstrip()
-        
-        # Now we know the actual number of parts
-        total_parts = len(parts)
-        
-        # Update available length with actual numbering length
-        actual_numbering_length = len(f"{total_parts}/{total_parts}: ")
-        actual_available_length = max_length - actual_numbering_length
-        
-        # If actual numbering is longer, we need to re-split the parts
-        if actual_numbering_length > max_numbering_length:
-            # Re-split with correct length
-            parts = []
-            remaining_text = message
-            while remaining_text:
-                if len(remaining_text) <= actual_available_length:
-                    parts.append(remaining_text)
-                    break
-                part, remaining_text = split_at_word_boundary(remaining_text, actual_available_length)
-                if part:
-                    parts.append(part)
-                else:
-                    parts.append(remaining_text[:actual_available_length])
-                    remaining_text = remaining_text[actual_available_length:].lstrip()
             total_parts = len(parts)
+        total_parts = len(parts)
         
         # Add numbering to each part
+        total_parts_str = str(total_parts)
         numbered_parts = []
         for i, part in enumerate(parts, 1):
-            numbered_part = f"{i}/{total_parts}: {part}"
+            prefix = f"{i}/{total_parts_str}: "
             
             # Safety check: If SMS is too long
-            if len(numbered_part) > max_length:
-                # If still too long, remove trailing spaces or split again
-                prefix = f"{i}/{total_parts}: "
-                remaining_length = max_length - len(prefix)
-                if remaining_length > 0:
-                    # Split part again at word boundary
-                    sub_part, _ = split_at_word_boundary(part, remaining_length)
-                    numbered_parts.append(f"{prefix}{sub_part}")
-                    # Rest will be handled in next iteration (should not occur)
-                else:
-                    # Fallback: Use part without numbering (should not occur)
-                    numbered_parts.append(part)
+            remaining_length = _part_length_limit(part, 0, max_length, len(prefix))
+            if len(part) > remaining_length:
+                # Split part again at word boundary (should not occur, the
+                # parts were split with space for the longest prefix)
+                end, _ = split_at_word_boundary(part, remaining_length)
+                numbered_parts.append(prefix + part[:end])
             else:
-                numbered_parts.append(numbered_part)
+                numbered_parts.append(prefix + part)
         
         return numbered_parts
     else:
         # No numbering - split at word boundaries
-        parts = []
-        remaining_text = message
-        while remaining_text:
-            if len(remaining_text) <= max_length:
-                parts.append(remaining_text)
-                break
-            part, remaining_text = split_at_word_boundary(remaining_text, max_length)
-            if part:
-                parts.append(part)
-            else:
-                # Fallback: Hard split
-                parts.append(remaining_text[:max_length])
-                remaining_text = remaining_text[max_length:].lstrip()
-        return parts
+        return _split_into_parts(message, max_length)
 
 
 def normalize_phone_number(phone_number: str) -> str:
@@ -209,13 +327,12 @@ def normalize_phone_number(phone_number: str) -> str:
         return phone_number
     
     # Remove spaces, dashes and other formatting characters
-    normalized = phone_number.replace(" ", "").replace("-", "").replace("(", "").replace(")", "").replace("/", "").replace(".", "")
+    normalized = phone_number.translate(_PHONE_STRIP_TABLE)
     
     # Convert +XX to 00XX (for all countries)
     if normalized.startswith("+"):
         # Find country code (1-3 digits after +)
-        import re
-        match = re.match(r'^\+(\d{1,3})(.*)$', normalized)
+        match = _COUNTRY_CODE_RE.match(normalized)
         if match:
             country_code = match.group(1)
             rest = match.group(2)
@@ -240,14 +357,42 @@ class TRB245SMS:
             password: Password for authentication
         """
         self.router_url = router_url.rstrip('/')
+        # Ensure we use HTTPS (the router API is only served via HTTPS)
+        if self.router_url.startswith('http://'):
+            self.router_url = 'https://' + self.router_url[len('http://'):]
+        elif not self.router_url.startswith('https://'):
+            self.router_url = f"https://{self.router_url}"
+        self._login_url = f"{self.router_url}/api/login"
+        self._modems_url = f"{self.router_url}/api/modems/status"
+        self._send_url = f"{self.router_url}/api/messages/actions/send"
         self.username = username
         self.password = password
         self.token = None
         self.token_expires_at = None
         self.session = requests.Session()
+        # Disable SSL verification for local routers (self-signed certificates)
+        self.session.verify = False
+        # Keep the router connection alive so multi-part SMS reuse one TLS handshake.
+        # Status retries only for GET: a retried POST could send an SMS twice.
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         # Token cache file based on router URL
-        cache_name = router_url.replace('https://', '').replace('http://', '').replace('/', '_').replace('.', '_')
+        cache_name = _URL_SCHEME_RE.sub('', router_url).translate(_CACHE_NAME_TABLE)
         self.token_cache_file = Path.home() / f".trb245_token_{cache_name}.json"
+        # (token, expires_at) last written to / read from the cache file
+        self._cached_token: Optional[tuple] = None
+        # Load a still valid token once, so is_token_valid never touches the disk
+        self.load_token_from_cache()
     
     def load_token_from_cache(self) -> bool:
         """
@@ -260,8 +405,8 @@ class TRB245SMS:
             return False
         
         try:
-            with open(self.token_cache_file, 'r') as f:
-                cache_data = json.load(f)
+            with open(self.token_cache_file, 'rb') as f:
+                cache_data = _json_loads(f.read())
             
             token = cache_data.get("token")
             expires_at = cache_data.get("expires_at")
@@ -274,6 +419,7 @@ class TRB245SMS:
             if current_time < expires_at - 10:
                 self.token = token
                 self.token_expires_at = expires_at
+                self._cached_token = (token, expires_at)
                 # Set token in session header
                 self.session.headers.update({
                     "Authorization": f"Bearer {self.token}"
@@ -307,18 +453,27 @@ class TRB245SMS:
             token: The token
             expires_seconds: Validity duration in seconds
         """
+        expires_at = time.time() + expires_seconds
+        # Skip the write if the cache already holds this token with (almost) the same expiration
+        if self._cached_token is not None:
+            cached_token, cached_expires_at = self._cached_token
+            if cached_token == token and abs(expires_at - cached_expires_at) < 10:
+                return
         try:
-            expires_at = time.time() + expires_seconds
             cache_data = {
                 "token": token,
                 "expires_at": expires_at,
                 "expires_seconds": expires_seconds,
                 "cached_at": time.time()
             }
-            with open(self.token_cache_file, 'w') as f:
-                json.dump(cache_data, f)
-            # Set file permissions to 600 (readable/writable by user only)
-            os.chmod(self.token_cache_file, 0o600)
+            # Create with permissions 600 (readable/writable by user only) and
+            # replace atomically so the token is never readable by others
+            tmp_file = self.token_cache_file.with_name(self.token_cache_file.name + ".tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(cache_data))
+            os.replace(tmp_file, self.token_cache_file)
+            self._cached_token = (token, expires_at)
         except IOError:
             pass  # Ignore save errors
     
@@ -329,14 +484,11 @@ class TRB245SMS:
         Returns:
             True if token is present and valid, False otherwise
         """
-        if not self.token:
-            return False
-        
-        if self.token_expires_at:
-            return time.time() < self.token_expires_at - 10  # 10 second buffer
-        else:
-            # If no expiration time stored, try loading from cache
-            return self.load_token_from_cache()
+        return (
+            bool(self.token)
+            and self.token_expires_at is not None
+            and time.time() < self.token_expires_at - 10  # 10 second buffer
+        )
     
     def authenticate(self, force: bool = False) -> bool:
         """
@@ -350,20 +502,11 @@ class TRB245SMS:
         Returns:
             True if successful, False otherwise
         """
-        # First check if a valid token is in cache
+        # First check if a valid token is loaded or in cache
         if not force:
-            if self.load_token_from_cache():
+            if self.is_token_valid() or self.load_token_from_cache():
                 return True
         
-        # Ensure we use HTTPS
-        if not self.router_url.startswith('http'):
-            self.router_url = f"https://{self.router_url}"
-        elif self.router_url.startswith('http://'):
-            # Convert HTTP to HTTPS
-            self.router_url = self.router_url.replace('http://', 'https://')
-        
-        login_url = f"{self.router_url}/api/login"
-        
         payload = {
             "username": self.username,
             "password": self.password
@@ -372,15 +515,14 @@ class TRB245SMS:
         try:
             # Disable SSL certificate verification (if self-signed)
             response = self.session.post(
-                login_url,
-                json=payload,
+                self._login_url,
+                data=_json_dumps(payload),
                 headers={"Content-Type": "application/json"},
-                timeout=10,
-                verify=False  # Disable SSL verification for local routers
+                timeout=10
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             
             # Token extraction: Response has structure {"success": true, "data": {"token": "...", "expires": 299}}
             expires_seconds = 299  # Default expiration
@@ -396,9 +538,10 @@ class TRB245SMS:
             elif "sysauth" in response.cookies:
                 self.token = response.cookies["sysauth"]
             else:
-                # Check all cookies
+                # Check all cookies, stop at the first auth/token cookie
                 for cookie in response.cookies:
-                    if "auth" in cookie.name.lower() or "token" in cookie.name.lower():
+                    cookie_name = cookie.name.lower()
+                    if "auth" in cookie_name or "token" in cookie_name:
                         self.token = cookie.value
                         break
             
@@ -437,14 +580,14 @@ class TRB245SMS:
         except requests.exceptions.SSLError as e:
             logger.error("SSL error: %s", e)
             logger.info("Trying with SSL verification disabled...")
-            # Already tried with verify=False, so it's a different problem
+            # Session already uses verify=False, so it's a different problem
             return False
         except requests.exceptions.RequestException as e:
             logger.error("Authentication error: %s", e)
             if hasattr(e, 'response') and e.response is not None:
                 logger.error("Response status: %s", e.response.status_code)
                 try:
-                    logger.error("Response: %s", e.response.json())
+                    logger.error("Response: %s", _json_loads(e.response.content))
                 except:
                     logger.error("Response text: %s", e.response.text[:200])
             return False
@@ -466,33 +609,26 @@ class TRB245SMS:
             if not self.authenticate():
                 return None
         
-        # Ensure we use HTTPS
-        if not self.router_url.startswith('https'):
-            if self.router_url.startswith('http://'):
-                self.router_url = self.router_url.replace('http://', 'https://')
-            else:
-                self.router_url = f"https://{self.router_url}"
-        
-        modems_url = f"{self.router_url}/api/modems/status"
-        
         try:
             response = self.session.get(
-                modems_url,
+                self._modems_url,
                 headers={"Content-Type": "application/json"},
-                timeout=10,
-                verify=False
+                timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.RequestException as e:
             logger.error("Error retrieving modems: %s", e)
             return None
+        except ValueError as e:
+            logger.error("Modem list is not valid JSON: %s", e)
+            return None
     
     def send_sms(
         self, 
         phone_number: str, 
         message: str, 
-        modem: Optional[str] = "1-1.4",
+        modem: Optional[str] = DEFAULT_MODEM_ID,
         split_long_messages: bool = True,
         max_sms_length: int = 160
     ) -> Dict[str, Any]:
@@ -503,7 +639,7 @@ class TRB245SMS:
             phone_number: Recipient phone number (e.g. "+491234567890" or "01511234567")
             message: Message to send
             modem: Modem ID (default: "1-1.4" for Primary)
-            split_long_messages: If True, messages > 160 characters are automatically split
+            split_long_messages: If True, messages > 160 characters (70 for UCS-2) are automatically split
             max_sms_length: Maximum length per SMS (default: 160 characters)
         
         Returns:
@@ -515,20 +651,31 @@ class TRB245SMS:
         # Check if token is present and valid
         if not self.is_token_valid():
             if not self.authenticate():
-                return {"success": False, "error": "Authentication failed"}
+                return {"success": False, "error": "Authentication failed", "auth_failed": True}
+        
+        # Modem is required - use "1-1.4" as default (Primary)
+        if not modem:
+            modem = DEFAULT_MODEM_ID
+        
+        # Request payload, shared by all parts (only the message changes)
+        payload = {
+            "data": {
+                "number": phone_number,
+                "message": message,
+                "modem": modem
+            }
+        }
         
         # Split long messages if desired
-        if split_long_messages and len(message) > max_sms_length:
+        if split_long_messages and not _fits_in_one_sms(message, max_sms_length):
             # Split message with numbering (e.g. "1/3: ", "2/3: ", "3/3: ")
             message_parts = split_sms_message(message, max_sms_length, add_numbering=True)
             total_parts = len(message_parts)
             logger.info(
-                "Message is %s characters long and will be split into %s SMS",
+                "Message is %s characters long and will be split into %s SMS "
+                "(numbered '1/%s: ', '2/%s: ', etc.)",
                 len(message),
-                total_parts
-            )
-            logger.info(
-                "Each SMS contains numbering (e.g. '1/%s: ', '2/%s: ', etc.)",
+                total_parts,
                 total_parts,
                 total_parts
             )
@@ -539,14 +686,15 @@ class TRB245SMS:
             all_successful = True
             
             for i, part in enumerate(message_parts, 1):
-                logger.info(
+                logger.debug(
                     "Sending part %s/%s (%s characters, starts with '%s...')",
                     i,
                     total_parts,
                     len(part),
                     part[:10]
                 )
-                result = self._send_single_sms(phone_number, part, modem)
+                payload["data"]["message"] = part
+                result = self._send_single_sms(payload)
                 all_results.append(result)
                 
                 if result.get("success"):
@@ -555,12 +703,17 @@ class TRB245SMS:
                 else:
                     all_successful = False
                     errors = result.get("errors", [])
-                    error_msg = "; ".join([e.get("error", "Unknown error") for e in errors])
+                    # Router errors, or the request error (e.g. HTTP 401) if there are none
+                    error_msg = (
+                        "; ".join([e.get("error", "Unknown error") for e in errors])
+                        or result.get("error", "Unknown error")
+                    )
                     logger.error("Part %s/%s failed: %s", i, total_parts, error_msg)
                     # Abort on error
                     return {
                         "success": False,
                         "error": f"Error sending part {i}/{total_parts}: {error_msg}",
+                        "status_code": result.get("status_code"),
                         "parts_sent": i - 1,
                         "total_parts": total_parts
                     }
@@ -581,65 +734,35 @@ class TRB245SMS:
             }
         else:
             # SMS sending (splitting not required or disabled)
-            return self._send_single_sms(phone_number, message, modem)
+            result = self._send_single_sms(payload)
+            if result.get("success"):
+                sms_used = result.get("data", {}).get("sms_used", "unknown")
+                logger.info("SMS sent successfully! (SMS used: %s)", sms_used)
+            return result
     
-    def _send_single_sms(
-        self,
-        phone_number: str,
-        message: str,
-        modem: str
-    ) -> Dict[str, Any]:
+    def _send_single_sms(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sends a single SMS message (internal method).
         
         Args:
-            phone_number: Normalized phone number
-            message: Message to send
-            modem: Modem ID
+            payload: Request payload {"data": {"number": ..., "message": ..., "modem": ...}}
+                with normalized phone number and modem ID
         
         Returns:
             Dictionary with router response
         """
-        # Endpoint for SMS sending (REST API)
-        # Ensure we use HTTPS
-        if not self.router_url.startswith('https'):
-            if self.router_url.startswith('http://'):
-                self.router_url = self.router_url.replace('http://', 'https://')
-            else:
-                self.router_url = f"https://{self.router_url}"
-        
-        send_url = f"{self.router_url}/api/messages/actions/send"
-        
-        # Modem is required - use "1-1.4" as default (Primary)
-        if not modem:
-            modem = "1-1.4"
-        
-        payload = {
-            "data": {
-                "number": phone_number,
-                "message": message,
-                "modem": modem
-            }
-        }
-        
         try:
             response = self.session.post(
-                send_url,
-                json=payload,
+                self._send_url,
+                data=_json_dumps(payload),
                 headers={"Content-Type": "application/json"},
-                timeout=30,
-                verify=False  # Disable SSL verification
+                timeout=30
             )
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             
-            if result.get("success"):
-                sms_used = result.get("data", {}).get("sms_used", "unknown")
-                # Only output for single SMS (multi-part is output above)
-                if len(message) <= 160:
-                    logger.info("SMS sent successfully! (SMS used: %s)", sms_used)
-            else:
+            if not result.get("success"):
                 errors = result.get("errors", [])
                 error_msg = "; ".join([e.get("error", "Unknown error") for e in errors])
                 logger.error("SMS sending failed: %s", error_msg)
@@ -672,19 +795,71 @@ class TRB245SMS:
             
         except requests.exceptions.RequestException as e:
             logger.error("Error sending SMS: %s", e)
+            status_code = None
             if hasattr(e, 'response') and e.response is not None:
+                status_code = e.response.status_code
                 try:
-                    error_data = e.response.json()
+                    error_data = _json_loads(e.response.content)
                     logger.error("Response: %s", error_data)
                 except:
                     logger.error("Response text: %s", e.response.text[:200])
-            return {"success": False, "error": str(e)}
+            return {"success": False, "error": str(e), "status_code": status_code}
+        except ValueError as e:
+            logger.error("Response is not valid JSON: %s", e)
+            return {"success": False, "error": f"Invalid response from router: {e}"}
+
+
+def resolve_primary_modem(
+    modems: Optional[Dict[str, Any]],
+    default: str = DEFAULT_MODEM_ID
+) -> str:
+    """
+    Determines the modem to send with from a /api/modems/status response.
+    
+    Args:
+        modems: Response from TRB245SMS.get_modems() (may be None)
+        default: Modem ID if the list is unavailable or empty
+    
+    Returns:
+        ID of the primary modem, otherwise of the first modem, otherwise default
+    """
+    if not modems or not modems.get("success") or not modems.get("data"):
+        logger.warning("Could not retrieve modem list, using fallback: %s", default)
+        return default
+    
+    data = modems["data"]
+    modem = next((modem for modem in data if modem.get("primary")), data[0])
+    return modem.get("id", default)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """
+    Reads and parses a config file (cached; errors are raised, not cached)
+    
+    Args:
+        config_path: Path to config file
+    
+    Returns:
+        Dictionary with configuration values
+    
+    Raises:
+        IOError: If the file is missing or cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+    return config or {}
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Loads configuration from config.yaml
     
+    A successfully loaded configuration is cached for the lifetime of the
+    process (treat it as read-only); if the file is missing or invalid, the
+    next call tries again.
+    
     Args:
         config_path: Path to config file (default: config.yaml in current directory)
     
@@ -696,15 +871,12 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     else:
         config_path = Path(config_path)
     
-    if not config_path.exists():
-        return {}
-    
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config or {}
+        return _read_config_file(config_path)
+    except FileNotFoundError:
+        return {}
     except (yaml.YAMLError, IOError) as e:
-        print(f"⚠ Warning: Could not load config.yaml: {e}")
+        print(f"[WARN] Warning: Could not load config.yaml: {e}")
         return {}
 
 
@@ -726,7 +898,7 @@ def main():
     if not config_file.exists():
         example_file = Path(__file__).parent / "config.yaml.example"
         if example_file.exists():
-            print("⚠ Warning: config.yaml not found!")
+            print("[WARN] Warning: config.yaml not found!")
             print(f"  Please copy {example_file.name} to config.yaml and adjust the values.")
             print("  Or use --router, --user and --password as command-line arguments.")
             print()
@@ -792,16 +964,16 @@ Environment variables:
     
     # Check if all required values are present
     if not args.router:
-        print("✗ Error: Router URL missing!")
-        print("  Please specify --router, set TRB245_ROUTER or create config.yaml")
+        print("[FAIL] Error: Router URL missing!\n"
+              "  Please specify --router, set TRB245_ROUTER or create config.yaml")
         sys.exit(1)
     if not args.user:
-        print("✗ Error: Username missing!")
-        print("  Please specify --user, set TRB245_USER or create config.yaml")
+        print("[FAIL] Error: Username missing!\n"
+              "  Please specify --user, set TRB245_USER or create config.yaml")
         sys.exit(1)
     if not args.password:
-        print("✗ Error: Password missing!")
-        print("  Please specify --password, set TRB245_PASSWORD or create config.yaml")
+        print("[FAIL] Error: Password missing!\n"
+              "  Please specify --password, set TRB245_PASSWORD or create config.yaml")
         sys.exit(1)
     
     # Initialize SMS class
@@ -809,13 +981,12 @@ Environment variables:
     
     # Authenticate
     if not sms.authenticate():
-        print("✗ Authentication failed. Please check credentials.")
+        print("[FAIL] Authentication failed. Please check credentials.")
         sys.exit(1)
     
-    # List modems if requested
+    # List modems if requested (output is written at once)
     if args.list_modems:
-        print("Available modems:")
-        print("-" * 80)
+        lines = ["Available modems:", "-" * 80]
         modems = sms.get_modems()
         if modems and modems.get("success") and "data" in modems:
             for modem in modems["data"]:
@@ -825,15 +996,16 @@ Environment variables:
                 state = modem.get("state", "unknown")
                 operator = modem.get("operator", "")
                 model = modem.get("model", "")
-                print(f"  ID: {modem_id}")
-                print(f"    Name: {modem_name}{primary}")
-                print(f"    Status: {state}")
-                print(f"    Operator: {operator}")
+                lines.append(f"  ID: {modem_id}")
+                lines.append(f"    Name: {modem_name}{primary}")
+                lines.append(f"    Status: {state}")
+                lines.append(f"    Operator: {operator}")
                 if model:
-                    print(f"    Model: {model}")
-                print()
+                    lines.append(f"    Model: {model}")
+                lines.append("")
         else:
-            print("  ✗ Could not retrieve modem list.")
+            lines.append("  [FAIL] Could not retrieve modem list.")
+        sys.stdout.write("\n".join(lines) + "\n")
         sys.exit(0)
     
     # Check if phone_number and message are specified
@@ -842,21 +1014,8 @@ Environment variables:
     
     # Set modem if not specified - try to find primary modem
     if not args.modem:
-        modems = sms.get_modems()
-        if modems and modems.get("success") and "data" in modems:
-            # Search for primary modem
-            for modem_info in modems["data"]:
-                if modem_info.get("primary"):
-                    args.modem = modem_info.get("id", "1-1.4")
-                    print(f"ℹ Using primary modem: {args.modem}")
-                    break
-            # If no primary found, use first modem
-            if not args.modem and modems["data"]:
-                args.modem = modems["data"][0].get("id", "1-1.4")
-                print(f"ℹ Using modem: {args.modem}")
-        else:
-            # Fallback to default
-            args.modem = "1-1.4"
+        args.modem = resolve_primary_modem(sms.get_modems())
+        print(f"[INFO] Using modem: {args.modem}")
     
     modem = args.modem
     
@@ -6,17 +6,95 @@ Accepts GET requests with URL parameters for sending SMS
 
 from fastapi import FastAPI, HTTPException, Query, Request, Body
 from fastapi.responses import JSONResponse
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pydantic import BaseModel
 import urllib.parse
 import re
+import asyncio
+import copy
 import logging
+from contextlib import asynccontextmanager
+import queue
 import time
+from logging.handlers import QueueHandler, QueueListener
 from starlette.middleware.base import BaseHTTPMiddleware
-from send_sms import TRB245SMS, load_config, normalize_phone_number
+from send_sms import TRB245SMS, load_config, normalize_phone_number, resolve_primary_modem
 from pathlib import Path
 
-# Configure logging
+# JSON responses: use orjson if installed (faster), otherwise Starlette's encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson when it is available"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of failing when the queue is full"""
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the message arguments now (they may change after logging), but
+        # keep exc_info so the listener thread formats the traceback
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def start_queue_logging() -> QueueListener:
+    """
+    Routes root logging through a queue so that writing log output to
+    stdout/files happens in a background thread instead of the event loop.
+    
+    The current root handlers (e.g. from uvicorn --log-config) are moved
+    behind the queue, so their format and destination are kept.
+    
+    Returns:
+        Started QueueListener (pass it to stop_queue_logging on shutdown)
+    """
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    
+    log_queue = queue.Queue(maxsize=10000)
+    root_logger.addHandler(DroppingQueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(listener: QueueListener):
+    """
+    Moves the handlers back to the root logger and writes pending log records
+    
+    Args:
+        listener: QueueListener returned by start_queue_logging
+    """
+    root_logger = logging.getLogger()
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, DroppingQueueHandler) and handler.queue is listener.queue:
+            root_logger.removeHandler(handler)
+    listener.stop()
+
+
+# Configure logging (no-op if uvicorn --log-config already configured the root logger)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -24,34 +102,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# URL-encoded character (%XX)
+_PERCENT_ENCODED_RE = re.compile(r'%[0-9A-Fa-f]{2}')
+
+
+async def refresh_router_client_periodically(cache: "SMSClientCache"):
+    """
+    Logs in again shortly before the cached client or its router token
+    expires, so that requests do not have to wait for authentication and
+    the modem list.
+    
+    Args:
+        cache: Router client cache to refresh
+    """
+    while True:
+        await asyncio.sleep(cache.refresh_delay())
+        try:
+            await cache.refresh()
+        except Exception as e:
+            logger.warning(
+                "[ROUTER] Background refresh failed, retrying in %.0fs: %s",
+                cache.refresh_delay(),
+                e
+            )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts queued logging and authenticates with the router at startup,
+    stops background tasks and flushes the log queue on shutdown
+    """
+    log_listener = start_queue_logging()
+    try:
+        try:
+            await sms_client_cache.refresh()
+        except Exception as e:
+            logger.warning("[ROUTER] Initial authentication failed, retrying on first request: %s", e)
+        refresh_task = asyncio.create_task(refresh_router_client_periodically(sms_client_cache))
+        try:
+            yield
+        finally:
+            refresh_task.cancel()
+    finally:
+        # Write pending log records before the process exits
+        stop_queue_logging(log_listener)
+
+
 app = FastAPI(
     title="SMS Gateway API",
     description="API for sending SMS via Teltonika Router",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 
 # Request-Logging-Middleware
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+        # Health checks (load balancer/monitoring probes) are not logged
+        if request.url.path == "/health":
+            return await call_next(request)
+        
+        start_time = time.perf_counter()
         
         # Log incoming request
-        client_ip = request.client.host if request.client else "unknown"
-        logger.info(f"[REQUEST] {request.method} {request.url.path} from {client_ip}")
-        if request.query_params:
+        if logger.isEnabledFor(logging.INFO):
+            client_ip = request.client.host if request.client else "unknown"
+            logger.info("[REQUEST] %s %s from %s", request.method, request.url.path, client_ip)
+        if request.query_params and logger.isEnabledFor(logging.DEBUG):
             # Log query parameters (without password)
-            safe_params = dict(request.query_params)
-            if 'password' in safe_params:
-                safe_params['password'] = '***'
-            logger.debug(f"[REQUEST] Query parameters: {safe_params}")
+            safe_params = [
+                (key, '***' if key == 'password' else value)
+                for key, value in request.query_params.multi_items()
+            ]
+            logger.debug("[REQUEST] Query parameters: %s", safe_params)
         
         # Process request
         response = await call_next(request)
         
         # Log response
-        process_time = time.time() - start_time
-        logger.info(f"[RESPONSE] Status {response.status_code} - {process_time:.3f}s")
+        process_time = time.perf_counter() - start_time
+        logger.info("[RESPONSE] Status %s - %.3fs", response.status_code, process_time)
         
         return response
 
@@ -82,10 +215,10 @@ def validate_api_credentials(username: str, password: str) -> bool:
         return False
     
     if username == expected_username and password == expected_password:
-        logger.info(f"[AUTH] Authentication successful for user: {username}")
+        logger.debug("[AUTH] Authentication successful for user: %s", username)
         return True
     else:
-        logger.warning(f"[AUTH] Authentication failed for user: {username}")
+        logger.warning("[AUTH] Authentication failed for user: %s", username)
         return False
 
 
@@ -106,14 +239,14 @@ def decode_url_parameter(param: str) -> str:
     
     # Check if URL-encoded characters are still present (%XX)
     # FastAPI usually decodes already, but we check for safety
-    if '%' in param and re.search(r'%[0-9A-Fa-f]{2}', param):
+    if '%' in param and _PERCENT_ENCODED_RE.search(param):
         try:
-            logger.debug(f"Decoding URL parameter (contains encoded characters): {param[:100]}...")
-            decoded = urllib.parse.unquote(param, encoding='utf-8')
-            logger.debug(f"After decoding: {decoded[:100]}...")
+            logger.debug("Decoding URL parameter (contains encoded characters): %s...", param[:100])
+            decoded = urllib.parse.unquote_to_bytes(param).decode('utf-8', errors='replace')
+            logger.debug("After decoding: %s...", decoded[:100])
             return decoded
         except Exception as e:
-            logger.warning(f"Error in URL decoding: {e}, using original")
+            logger.warning("Error in URL decoding: %s, using original", e)
             # If decoding fails, return original
             return param
     
@@ -121,134 +254,231 @@ def decode_url_parameter(param: str) -> str:
     return param
 
 
-class SMSRequest(BaseModel):
-    """Model for POST request body"""
-    username: str
-    password: str
-    number: str
-    text: str
+class SMSClientCache:
+    """Authenticated router client and primary modem ID, reused between requests"""
+    
+    def __init__(self, ttl: float = 300):
+        """
+        Args:
+            ttl: Seconds until the client is re-authenticated and the modem list re-queried
+        """
+        self.ttl = ttl
+        self.client: Optional[TRB245SMS] = None
+        self.modem_id: Optional[str] = None
+        self.expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+    
+    def invalidate(self):
+        """Marks the cached client as expired so the next request authenticates again"""
+        self.expires_at = 0.0
+    
+    async def get(self, force_auth: bool = False) -> Tuple[TRB245SMS, str]:
+        """
+        Returns the cached client and modem ID, refreshing them after the TTL.
+        
+        Args:
+            force_auth: If True, requests a new router token even if the current
+                one has not expired yet (use after invalidate())
+        
+        Returns:
+            Tuple (authenticated TRB245SMS instance, modem ID)
+        
+        Raises:
+            HTTPException: If the router configuration is missing or authentication fails
+        """
+        if self.client is not None and time.monotonic() < self.expires_at:
+            return self.client, self.modem_id
+        async with self._get_lock():
+            # Another request may have refreshed the client while we waited
+            if self.client is not None and time.monotonic() < self.expires_at:
+                return self.client, self.modem_id
+            return await self._authenticate_client(force_auth)
+    
+    async def refresh(self) -> Tuple[TRB245SMS, str]:
+        """
+        Logs in again with a new router token and re-queries the modem list,
+        even if the cached client has not expired yet.
+        
+        Returns:
+            Tuple (authenticated TRB245SMS instance, modem ID)
+        
+        Raises:
+            HTTPException: If the router configuration is missing or authentication fails
+        """
+        async with self._get_lock():
+            return await self._authenticate_client(force_auth=True)
+    
+    def refresh_delay(self, margin: float = 30) -> float:
+        """
+        Returns the seconds until the client should be refreshed in the background.
+        
+        Args:
+            margin: Seconds before the cache TTL or the router token expires
+        
+        Returns:
+            Delay in seconds (at least 10, also after a failed refresh)
+        """
+        remaining = self.expires_at - time.monotonic()
+        if self.client is not None and self.client.token_expires_at is not None:
+            remaining = min(remaining, self.client.token_expires_at - time.time())
+        return max(remaining - margin, 10)
+    
+    def _get_lock(self) -> asyncio.Lock:
+        # Created on first use so it belongs to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+    
+    async def _create_client(self) -> TRB245SMS:
+        """Creates the router client from config.yaml (reads the token cache file)"""
+        # Load router configuration
+        config = load_config()
+        router_config = config.get("router", {})
+        
+        # Use router credentials from config
+        router_url = router_config.get("url")
+        router_user = router_config.get("username")
+        router_password = router_config.get("password")
+        
+        if not router_url or not router_user or not router_password:
+            logger.error("[FASTAPI-SERVER] Configuration error: Router credentials missing")
+            raise HTTPException(
+                status_code=500,
+                detail="Router configuration missing. Please configure config.yaml."
+            )
+        
+        return await asyncio.to_thread(TRB245SMS, router_url, router_user, router_password)
+    
+    async def _authenticate_client(self, force_auth: bool = False) -> Tuple[TRB245SMS, str]:
+        """Authenticates the client and resolves the modem (lock must be held)"""
+        # The client (and its keep-alive session) is created once and reused
+        if self.client is None:
+            self.client = await self._create_client()
+        sms = self.client
+        
+        # Authenticate
+        if not await asyncio.to_thread(sms.authenticate, force_auth):
+            logger.error("[ROUTER] Authentication failed")
+            raise HTTPException(
+                status_code=401,
+                detail="Authentication with router failed"
+            )
+        
+        # Find primary modem automatically
+        modems = await asyncio.to_thread(sms.get_modems)
+        modem_id = resolve_primary_modem(modems)
+        logger.info(
+            "[ROUTER] [OK] Authenticated as %s at %s, using modem %s",
+            sms.username,
+            sms.router_url,
+            modem_id
+        )
+        
+        self.modem_id = modem_id
+        self.expires_at = time.monotonic() + self.ttl
+        return sms, modem_id
+
 
+sms_client_cache = SMSClientCache()
 
-async def process_sms_request(phone_number: str, message: str):
+
+def is_router_auth_error(result: Dict[str, Any]) -> bool:
     """
-    Common function to process SMS sending request
+    Checks if a failed send result was caused by a rejected router token.
+    
+    Only results where no part was sent yet qualify, so a retry cannot
+    deliver parts twice.
     
     Args:
-        phone_number: Phone number to send SMS to
-        message: SMS message text
+        result: Result dictionary from TRB245SMS.send_sms
     
     Returns:
-        Response dictionary with SMS sending result
+        True if the send should be retried after re-authentication
+    """
+    if result.get("success") or result.get("parts_sent"):
+        return False
+    return result.get("status_code") == 401 or bool(result.get("auth_failed"))
+
+
+def parse_and_validate(raw_number: str, raw_text: str) -> Tuple[str, str]:
     """
-    # Decode URL parameters
-    logger.info("Decoding parameters...")
-    phone_number = decode_url_parameter(phone_number)
-    message = decode_url_parameter(message)
-    logger.info(f"Number (decoded): {phone_number} (length: {len(phone_number)})")
-    logger.info(f"Text (decoded): {message[:100]}... (length: {len(message)})")
+    Decodes and normalizes the request parameters and checks they are not empty
     
-    # Normalize phone number (converts +49 to 0049, +XX to 00XX, etc.)
-    phone_number_original = phone_number
-    phone_number = normalize_phone_number(phone_number)
-    if phone_number != phone_number_original:
-        logger.info(f"Phone number normalized: {phone_number_original} → {phone_number}")
+    Args:
+        raw_number: Phone number as received
+        raw_text: SMS text as received
     
-    # Validation
-    logger.info("Validating parameters...")
+    Returns:
+        Tuple (normalized phone number, message)
+    
+    Raises:
+        HTTPException: 400 if phone number or message is empty
+    """
+    # Normalize phone number (converts +49 to 0049, +XX to 00XX, etc.)
+    phone_number = normalize_phone_number(decode_url_parameter(raw_number))
     if not phone_number:
-        logger.error("[FASTAPI-SERVER] Validation error: Phone number is empty")
         raise HTTPException(
             status_code=400,
             detail="Phone number (number) is required and must not be empty"
         )
     
+    message = decode_url_parameter(raw_text)
     if not message:
-        logger.error("[FASTAPI-SERVER] Validation error: Message is empty")
         raise HTTPException(
             status_code=400,
             detail="Message (text) is required and must not be empty"
         )
     
-    logger.info("✓ Parameter validation successful")
-    
-    # Load router configuration
-    logger.info("Loading router configuration...")
-    config = load_config()
-    router_config = config.get("router", {})
-    
-    # Use router credentials from config
-    router_url = router_config.get("url")
-    router_user = router_config.get("username")
-    router_password = router_config.get("password")
-    
-    if not router_url or not router_user or not router_password:
-        logger.error("[FASTAPI-SERVER] Configuration error: Router credentials missing")
-        raise HTTPException(
-            status_code=500,
-            detail="Router configuration missing. Please configure config.yaml."
-        )
+    return phone_number, message
+
+
+class SMSRequest(BaseModel):
+    """Model for POST request body"""
+    username: str
+    password: str
+    number: str
+    text: str
+
+
+async def process_sms_request(phone_number: str, message: str, ctx: Dict[str, Any]):
+    """
+    Common function to process SMS sending request
     
-    logger.info(f"Router URL: {router_url}")
-    logger.info(f"Router User: {router_user}")
+    Args:
+        phone_number: Phone number to send SMS to
+        message: SMS message text
+        ctx: Request log context, filled with the processing details
     
-    # Initialize SMS class
-    logger.info("Initializing SMS class...")
-    sms = TRB245SMS(router_url, router_user, router_password)
+    Returns:
+        Response dictionary with SMS sending result
+    """
+    phone_number, message = parse_and_validate(phone_number, message)
+    ctx["phone"] = phone_number
+    ctx["msg_len"] = len(message)
     
-    # Authenticate
-    logger.info("Authenticating with router...")
-    if not sms.authenticate():
-        logger.error("[ROUTER] Authentication failed")
-        raise HTTPException(
-            status_code=401,
-            detail="Authentication with router failed"
-        )
-    logger.info("✓ Authentication with router successful")
-    
-    # Find primary modem automatically
-    logger.info("Determining available modems...")
-    modems = sms.get_modems()
-    modem_id = "1-1.4"  # Fallback
-    if modems and modems.get("success") and "data" in modems:
-        logger.info(f"Available modems: {len(modems['data'])}")
-        for modem_info in modems["data"]:
-            if modem_info.get("primary"):
-                modem_id = modem_info.get("id", "1-1.4")
-                logger.info(f"✓ Primary modem found: {modem_id}")
-                break
-        if modem_id == "1-1.4" and modems["data"]:
-            modem_id = modems["data"][0].get("id", "1-1.4")
-            logger.info(f"Using first available modem: {modem_id}")
-    else:
-        logger.warning(f"Could not retrieve modem list, using fallback: {modem_id}")
+    # Authenticated router client and modem (cached between requests)
+    sms, modem_id = await sms_client_cache.get()
+    ctx["modem"] = modem_id
     
     # Send SMS (automatic splitting for > 160 characters)
-    logger.info("=" * 80)
-    logger.info(f"[ROUTER] Sending SMS to {phone_number} via modem {modem_id}")
-    logger.info(f"Message (first 200 characters): {message[:200]}")
-    logger.info(f"Message length: {len(message)} characters")
-    
-    # Check if message needs to be split
-    if len(message) > 160:
-        logger.info(f"ℹ Message is longer than 160 characters and will be automatically split")
-    
-    result = sms.send_sms(phone_number, message, modem_id)
-    
-    # Log complete router response
-    logger.info("=" * 80)
-    logger.info("[ROUTER] Response from router:")
-    logger.info(f"  Success: {result.get('success')}")
-    logger.info(f"  Complete response: {result}")
+    logger.debug("[ROUTER] Message (first 200 characters): %s", message[:200])
+    result = await asyncio.to_thread(sms.send_sms, phone_number, message, modem_id)
+    if is_router_auth_error(result):
+        # Token was rejected by the router (e.g. router restarted): log in again and retry once
+        logger.warning("[ROUTER] Authentication rejected, re-authenticating and retrying")
+        sms_client_cache.invalidate()
+        sms, modem_id = await sms_client_cache.get(force_auth=True)
+        ctx["modem"] = modem_id
+        result = await asyncio.to_thread(sms.send_sms, phone_number, message, modem_id)
+    
+    logger.debug("[ROUTER] Complete response: %s", result)
+    ctx["router_success"] = bool(result.get("success"))
     
     if result.get("success"):
         sms_used = result.get("data", {}).get("sms_used", 0)
         parts = result.get("data", {}).get("parts", 1)
-        
-        if parts > 1:
-            logger.info(f"✓ SMS sent successfully! ({parts} parts, total {sms_used} SMS)")
-        else:
-            logger.info(f"✓ SMS sent successfully! (SMS used: {sms_used})")
-        logger.info("=" * 80)
+        ctx["sms_used"] = sms_used
+        ctx["parts"] = parts
         
         response_content = {
             "success": True,
@@ -263,75 +493,82 @@ async def process_sms_request(phone_number: str, message: str):
             response_content["parts"] = parts
             response_content["message"] = f"SMS sent successfully ({parts} parts)"
         
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=200,
             content=response_content
         )
     else:
         errors = result.get("errors", [])
-        error_msg = "; ".join([e.get("error", "Unknown error") for e in errors])
-        logger.error("=" * 80)
-        logger.error("[ROUTER] SMS sending failed!")
-        logger.error(f"  Error details: {error_msg}")
-        logger.error(f"  Complete error objects: {errors}")
-        logger.error("=" * 80)
+        error_msg = "; ".join([e.get("error", "Unknown error") for e in errors]) or result.get("error", "Unknown error")
+        ctx["router_errors"] = errors
         raise HTTPException(
             status_code=422,
             detail=f"SMS sending failed (error from router): {error_msg}"
         )
 
 
-@app.get("/")
-async def send_sms_get(
-    username: str = Query(..., description="API username"),
-    password: str = Query(..., description="API password"),
-    number: str = Query(..., description="Phone number"),
-    text: str = Query(..., description="SMS text")
-):
+async def handle_sms_request(method: str, username: str, password: str, number: str, text: str):
     """
-    Sends an SMS via the router (GET method)
+    Validates API credentials, sends the SMS and logs one line per request
     
-    Parameters are automatically URL-decoded by FastAPI (UTF-8).
+    Args:
+        method: HTTP method (for logging)
+        username: API username
+        password: API password
+        number: Phone number (raw)
+        text: SMS text (raw)
     
-    Example:
-        GET /?username=apiuser&password=apipass&number=%2B491234567890&text=Hello%20World
+    Returns:
+        JSON response with SMS sending result
     """
-    logger.info("=" * 80)
-    logger.info("New SMS request received (GET)")
-    logger.info(f"Username: {username}")
-    logger.info(f"Number (raw): {number[:50]}... (length: {len(number)})")
-    logger.info(f"Text (raw): {text[:100]}... (length: {len(text)})")
-    
+    ctx: Dict[str, Any] = {"method": method, "user": username}
     try:
         # Validate API credentials
         if not validate_api_credentials(username, password):
-            logger.error("[AUTH] API authentication failed")
             raise HTTPException(
                 status_code=401,
                 detail="Invalid API credentials"
             )
         
-        return await process_sms_request(number, text)
+        response = await process_sms_request(number, text, ctx)
+        ctx["status"] = response.status_code
+        logger.info("sms_request %s", ctx)
+        return response
     
     except HTTPException as e:
-        logger.error("=" * 80)
-        logger.error(f"[FASTAPI-SERVER] HTTPException: Status {e.status_code}")
-        logger.error(f"  Detail: {e.detail}")
-        logger.error("=" * 80)
+        ctx["status"] = e.status_code
+        ctx["error"] = e.detail
+        logger.error("sms_request %s", ctx)
         raise
     except Exception as e:
-        logger.error("=" * 80)
-        logger.error(f"[FASTAPI-SERVER] Unexpected error: {type(e).__name__}")
-        logger.error(f"  Error: {str(e)}")
-        import traceback
-        logger.error(f"  Traceback:\n{traceback.format_exc()}")
-        logger.error("=" * 80)
+        ctx["status"] = 500
+        ctx["error"] = f"{type(e).__name__}: {e}"
+        # The traceback is formatted by the queue listener thread, not on the request path
+        logger.exception("sms_request %s", ctx)
         raise HTTPException(
             status_code=500,
             detail=f"Internal error: {str(e)}"
         )
 
 
+@app.get("/")
+async def send_sms_get(
+    username: str = Query(..., description="API username"),
+    password: str = Query(..., description="API password"),
+    number: str = Query(..., description="Phone number"),
+    text: str = Query(..., description="SMS text")
+):
+    """
+    Sends an SMS via the router (GET method)
+    
+    Parameters are automatically URL-decoded by FastAPI (UTF-8).
+    
+    Example:
+        GET /?username=apiuser&password=apipass&number=%2B491234567890&text=Hello%20World
+    """
+    return await handle_sms_request("GET", username, password, number, text)
+
+
 @app.post("/")
 async def send_sms_post(request: SMSRequest = Body(...)):
     """
@@ -352,40 +589,7 @@ async def send_sms_post(request: SMSRequest = Body(...)):
             "text": "Hello World"
         }
     """
-    logger.info("=" * 80)
-    logger.info("New SMS request received (POST)")
-    logger.info(f"Username: {request.username}")
-    logger.info(f"Number (raw): {request.number[:50]}... (length: {len(request.number)})")
-    logger.info(f"Text (raw): {request.text[:100]}... (length: {len(request.text)})")
-    
-    try:
-        # Validate API credentials
-        if not validate_api_credentials(request.username, request.password):
-            logger.error("[AUTH] API authentication failed")
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid API credentials"
-            )
-        
-        return await process_sms_request(request.number, request.text)
-    
-    except HTTPException as e:
-        logger.error("=" * 80)
-        logger.error(f"[FASTAPI-SERVER] HTTPException: Status {e.status_code}")
-        logger.error(f"  Detail: {e.detail}")
-        logger.error("=" * 80)
-        raise
-    except Exception as e:
-        logger.error("=" * 80)
-        logger.error(f"[FASTAPI-SERVER] Unexpected error: {type(e).__name__}")
-        logger.error(f"  Error: {str(e)}")
-        import traceback
-        logger.error(f"  Traceback:\n{traceback.format_exc()}")
-        logger.error("=" * 80)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal error: {str(e)}"
-        )
+    return await handle_sms_request("POST", request.username, request.password, request.number, request.text)
 
 
 # Legacy endpoint - kept for backward compatibility but now requires authentication
@@ -416,5 +620,5 @@ if __name__ == "__main__":
     server_config = config.get("server", {})
     port = server_config.get("port", 8000)
     
-    logger.info(f"Starting SMS Gateway API on port {port}")
+    logger.info("Starting SMS Gateway API on port %s", port)
     uvicorn.run(app, host="0.0.0.0", port=port)